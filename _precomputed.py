@@ -0,0 +1,128 @@
+# _precomputed.py
+# Page bodies and /submit routing, built once at import from constants
+
+from isal import igzip
+import orjson
+import pybase64
+import os
+
+PDF_SUM_ANSWER = 60
+IMAGE_OCR_ANSWER = 777
+AUDIO_ANSWER = 12
+PUZZLE_ANSWER = 42
+
+_CSV_TEXT = "name,value\nA,10\nB,20\nC,30\n"
+_CSV_B64 = pybase64.b64encode_as_string(_CSV_TEXT.encode())
+_AUDIO_B64 = pybase64.b64encode_as_string(b"numbers 3 4 5")
+_PUZZLE_B64 = pybase64.b64encode_as_string(
+    igzip.compress(orjson.dumps({"secret_sum": PUZZLE_ANSWER}), compresslevel=1, mtime=0)
+)
+
+def wrap_atob(x: bytes):
+    return pybase64.b64encode_as_string(x)
+
+
+def get_base_url():
+    # Railway sets RAILWAY_PUBLIC_DOMAIN
+    domain = os.environ.get("RAILWAY_PUBLIC_DOMAIN")
+    if domain:
+        return f"https://{domain}"
+    return "http://localhost:8001"
+
+BASE_URL = get_base_url()
+
+
+def _build_root_html():
+    return f"""
+    <h2>Fake TDS Quiz Server OK</h2>
+    <p>BASE_URL = {BASE_URL}</p>
+    <ul>
+        <li><a href="/pdf-demo">PDF Demo</a></li>
+        <li><a href="/image-demo">Image Demo</a></li>
+        <li><a href="/audio-demo">Audio Demo</a></li>
+        <li><a href="/puzzle-demo">Puzzle Demo</a></li>
+    </ul>
+    """
+
+
+def _build_pdf_html():
+    instructions = orjson.dumps({
+        "task": "Compute sum of CSV values",
+        "file_data_uri": f"data:text/csv;base64,{_CSV_B64}",
+        "submit_url": "/submit",
+        "url": "/pdf-demo"
+    })
+
+    return f"""
+    <div id="result"></div>
+    <script>
+      document.querySelector("#result").innerHTML = atob(`{wrap_atob(instructions)}`);
+    </script>
+    """
+
+
+def _build_image_html():
+    instructions = orjson.dumps({
+        "task": "OCR image",
+        "image_path": "/static/fake.png",
+        "submit_url": "/submit",
+        "url": "/image-demo"
+    })
+    return f"""
+    <div id="result"></div>
+    <script>
+      document.querySelector("#result").innerHTML = atob(`{wrap_atob(instructions)}`);
+    </script>
+    <p>Expected answer = {IMAGE_OCR_ANSWER}</p>
+    """
+
+
+def _build_audio_html():
+    instructions = orjson.dumps({
+        "task": "Decode audio, sum numbers",
+        "audio_data_uri": f"data:audio/wav;base64,{_AUDIO_B64}",
+        "submit_url": "/submit",
+        "url": "/audio-demo"
+    })
+
+    return f"""
+    <div id="result"></div>
+    <script>
+      document.querySelector("#result").innerHTML = atob(`{wrap_atob(instructions)}`);
+    </script>
+    <p>Expected answer = {AUDIO_ANSWER}</p>
+    """
+
+
+def _build_puzzle_html():
+    instructions = orjson.dumps({
+        "task": "Decode and gunzip",
+        "payload_gz_b64": _PUZZLE_B64,
+        "submit_url": "/submit",
+        "url": "/puzzle-demo"
+    })
+
+    return f"""
+    <div id="result"></div>
+    <script>
+      document.querySelector("#result").innerHTML = atob(`{wrap_atob(instructions)}`);
+    </script>
+    <p>Expected answer = {PUZZLE_ANSWER}</p>
+    """
+
+
+# Every page depends only on constants and BASE_URL, so render and encode once at import.
+ROOT_BYTES = _build_root_html().encode("utf-8")
+PDF_BYTES = _build_pdf_html().encode("utf-8")
+IMAGE_BYTES = _build_image_html().encode("utf-8")
+AUDIO_BYTES = _build_audio_html().encode("utf-8")
+PUZZLE_BYTES = _build_puzzle_html().encode("utf-8")
+
+
+# Final path segment of a quiz URL -> (expected answer, next quiz URL).
+ROUTING = {
+    "pdf-demo": (PDF_SUM_ANSWER, f"{BASE_URL}/image-demo"),
+    "image-demo": (IMAGE_OCR_ANSWER, f"{BASE_URL}/audio-demo"),
+    "audio-demo": (AUDIO_ANSWER, f"{BASE_URL}/puzzle-demo"),
+    "puzzle-demo": (PUZZLE_ANSWER, None),
+}
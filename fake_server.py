@@ -2,163 +2,93 @@
 # FINAL — 100% Railway Compatible Fake TDS Server
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, Response
+from pydantic import BaseModel, ValidationError, field_validator
 import uvicorn
-import json
-import base64
-import gzip
 import os
 
-app = FastAPI()
-
-PDF_SUM_ANSWER = 60
-IMAGE_OCR_ANSWER = 777
-AUDIO_ANSWER = 12
-PUZZLE_ANSWER = 42
-
-def wrap_atob(x: str):
-    return base64.b64encode(x.encode()).decode()
+from _precomputed import (
+    ROOT_BYTES,
+    PDF_BYTES,
+    IMAGE_BYTES,
+    AUDIO_BYTES,
+    PUZZLE_BYTES,
+    ROUTING,
+)
 
+app = FastAPI()
 
-def get_base_url():
-    # Railway sets RAILWAY_PUBLIC_DOMAIN
-    domain = os.environ.get("RAILWAY_PUBLIC_DOMAIN")
-    if domain:
-        return f"https://{domain}"
-    return "http://localhost:8001"
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
 
-BASE_URL = get_base_url()
+# Demo pages use relative URLs, so their bodies are identical for every host.
+DEMO_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600, immutable"}
 
 
 @app.get("/", response_class=HTMLResponse)
 async def root():
-    return f"""
-    <h2>Fake TDS Quiz Server OK</h2>
-    <p>BASE_URL = {BASE_URL}</p>
-    <ul>
-        <li><a href="{BASE_URL}/pdf-demo">PDF Demo</a></li>
-        <li><a href="{BASE_URL}/image-demo">Image Demo</a></li>
-        <li><a href="{BASE_URL}/audio-demo">Audio Demo</a></li>
-        <li><a href="{BASE_URL}/puzzle-demo">Puzzle Demo</a></li>
-    </ul>
-    """
+    return Response(content=ROOT_BYTES, media_type=HTML_MEDIA_TYPE)
 
 
 @app.get("/pdf-demo", response_class=HTMLResponse)
 async def pdf_demo():
-    csv = "name,value\nA,10\nB,20\nC,30\n"
-    b64 = base64.b64encode(csv.encode()).decode()
-
-    instructions = json.dumps({
-        "task": "Compute sum of CSV values",
-        "file_data_uri": f"data:text/csv;base64,{b64}",
-        "submit_url": f"{BASE_URL}/submit",
-        "url": f"{BASE_URL}/pdf-demo"
-    })
-
-    return HTMLResponse(f"""
-    <div id="result"></div>
-    <script>
-      document.querySelector("#result").innerHTML = atob(`{wrap_atob(instructions)}`);
-    </script>
-    """)
+    return Response(content=PDF_BYTES, media_type=HTML_MEDIA_TYPE, headers=DEMO_CACHE_HEADERS)
 
 
 @app.get("/image-demo", response_class=HTMLResponse)
 async def image_demo():
-    instructions = json.dumps({
-        "task": "OCR image",
-        "image_path": "/static/fake.png",
-        "submit_url": f"{BASE_URL}/submit",
-        "url": f"{BASE_URL}/image-demo"
-    })
-    return HTMLResponse(f"""
-    <div id="result"></div>
-    <script>
-      document.querySelector("#result").innerHTML = atob(`{wrap_atob(instructions)}`);
-    </script>
-    <p>Expected answer = {IMAGE_OCR_ANSWER}</p>
-    """)
+    return Response(content=IMAGE_BYTES, media_type=HTML_MEDIA_TYPE, headers=DEMO_CACHE_HEADERS)
 
 
 @app.get("/audio-demo", response_class=HTMLResponse)
 async def audio_demo():
-
-    audio_b64 = base64.b64encode(b"numbers 3 4 5").decode()
-
-    instructions = json.dumps({
-        "task": "Decode audio, sum numbers",
-        "audio_data_uri": f"data:audio/wav;base64,{audio_b64}",
-        "submit_url": f"{BASE_URL}/submit",
-        "url": f"{BASE_URL}/audio-demo"
-    })
-
-    return HTMLResponse(f"""
-    <div id="result"></div>
-    <script>
-      document.querySelector("#result").innerHTML = atob(`{wrap_atob(instructions)}`);
-    </script>
-    <p>Expected answer = {AUDIO_ANSWER}</p>
-    """)
+    return Response(content=AUDIO_BYTES, media_type=HTML_MEDIA_TYPE, headers=DEMO_CACHE_HEADERS)
 
 
 @app.get("/puzzle-demo", response_class=HTMLResponse)
 async def puzzle_demo():
+    return Response(content=PUZZLE_BYTES, media_type=HTML_MEDIA_TYPE, headers=DEMO_CACHE_HEADERS)
+
 
-    payload = {"secret_sum": PUZZLE_ANSWER}
-    gz = gzip.compress(json.dumps(payload).encode())
-    b64 = base64.b64encode(gz).decode()
+class SubmitIn(BaseModel):
+    email: str | None = None
+    secret: str | None = None
+    url: str | None = None
+    answer: float | None = None
 
-    instructions = json.dumps({
-        "task": "Decode and gunzip",
-        "payload_gz_b64": b64,
-        "submit_url": f"{BASE_URL}/submit",
-        "url": f"{BASE_URL}/puzzle-demo"
-    })
+    @field_validator("answer", mode="wrap")
+    @classmethod
+    def _answer_or_none(cls, value, handler):
+        # A non-numeric answer is reported as "not numeric", not rejected.
+        try:
+            return handler(value)
+        except ValidationError:
+            return None
 
-    return HTMLResponse(f"""
-    <div id="result"></div>
-    <script>
-      document.querySelector("#result").innerHTML = atob(`{wrap_atob(instructions)}`);
-    </script>
-    <p>Expected answer = {PUZZLE_ANSWER}</p>
-    """)
 
+class SubmitOut(BaseModel):
+    correct: bool
+    reason: str
+    url: str | None
 
-@app.post("/submit")
+
+@app.post("/submit", response_model=SubmitOut)
 async def submit(req: Request):
+    # Parse the raw body so clients that omit Content-Type still work.
     try:
-        data = await req.json()
-    except:
+        payload = SubmitIn.model_validate_json(await req.body())
+    except ValidationError:
         raise HTTPException(400, "invalid json")
 
-    url = data.get("url")
-    answer = data.get("answer")
-
-    if not url:
+    if not payload.url:
         return {"correct": False, "reason": "missing url", "url": None}
 
-    if url.endswith("/pdf-demo"):
-        expected = PDF_SUM_ANSWER
-        next_url = f"{BASE_URL}/image-demo"
-
-    elif url.endswith("/image-demo"):
-        expected = IMAGE_OCR_ANSWER
-        next_url = f"{BASE_URL}/audio-demo"
-
-    elif url.endswith("/audio-demo"):
-        expected = AUDIO_ANSWER
-        next_url = f"{BASE_URL}/puzzle-demo"
-
-    elif url.endswith("/puzzle-demo"):
-        expected = PUZZLE_ANSWER
-        next_url = None
-    else:
+    try:
+        expected, next_url = ROUTING[payload.url.rsplit("/", 1)[-1]]
+    except KeyError:
         return {"correct": False, "reason": "unknown url", "url": None}
 
-    try:
-        ans = float(answer)
-    except:
+    ans = payload.answer
+    if ans is None:
         return {"correct": False, "reason": "not numeric", "url": next_url}
 
     return {
@@ -170,4 +100,32 @@ async def submit(req: Request):
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run("fake_server:app", host="0.0.0.0", port=port)
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 2))
+    access_log = os.environ.get("ACCESS_LOG", "0") == "1"
+
+    if os.environ.get("SERVER", "granian") == "granian":
+        from granian import Granian
+        from granian.constants import Interfaces, Loops
+        from granian.log import LogLevels
+
+        Granian(
+            "fake_server:app",
+            address="0.0.0.0",
+            port=port,
+            interface=Interfaces.ASGI,
+            workers=workers,
+            loop=Loops.uvloop,
+            log_level=LogLevels.warning,
+            log_access=access_log,
+        ).serve()
+    else:
+        uvicorn.run(
+            "fake_server:app",
+            host="0.0.0.0",
+            port=port,
+            workers=workers,
+            access_log=access_log,
+            loop="uvloop",
+            http="httptools",
+            log_level="warning",
+        )